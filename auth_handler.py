@@ -2,15 +2,130 @@
 Authentication handler for MathWorks
 """
 
-import time
 import logging
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from config import Config
-from utils import ElementFinder, ActionHelper
+from utils import ElementFinder, ActionHelper, to_locators
 
 logger = logging.getLogger(__name__)
 
+# Login selectors from config, looked up once
+_LOGIN_CONFIG = Config.SELECTORS['login']
+
+# Selector fallback lists, classified into locators once at import time
+_USERNAME_SELECTORS = to_locators([
+    'input[name="userId"]',
+    '#userId',
+    'input[type="email"][name="userId"]',
+    '.form-control[name="userId"]',
+    'input.form-control[name="userId"]',
+    'input[id="userId"]',
+    'input[class*="form-control"][name="userId"]',
+    # Additional fallback selectors
+    'input[type="email"]',
+    'input[name="email"]',
+    'input[placeholder*="email"]',
+    'input[placeholder*="Email"]',
+    '.form-control[type="email"]',
+    _LOGIN_CONFIG['username_field'],
+    '#email',
+    'input[name="username"]'
+])
+
+_EMAIL_SUBMIT_SELECTORS = to_locators([
+    'button[type="submit"]',
+    '//button[contains(text(), "Next")]',
+    '//button[contains(text(), "Continue")]',
+    '//button[contains(text(), "Submit")]',
+    '.btn[type="submit"]',
+    _LOGIN_CONFIG['submit_button']
+])
+
+_PASSWORD_SELECTORS = to_locators([
+    _LOGIN_CONFIG['password_field'],
+    'input[name="password"]',
+    'input[type="password"]',
+    '#password'
+])
+
+_FINAL_SUBMIT_SELECTORS = to_locators([
+    'button[type="submit"]',
+    'input[type="submit"]',
+    '//button[contains(text(), "Sign In")]',
+    '//button[contains(text(), "Login")]',
+    '//button[contains(text(), "Submit")]',
+    _LOGIN_CONFIG['submit_button']
+])
+
+# Post-login indicators
+_SUCCESS_INDICATORS = to_locators([
+    '.user-menu',
+    '.logout',
+    '.dashboard',
+    '[data-testid*="user"]',
+    '.profile'
+])
+
+_ERROR_SELECTORS = to_locators([
+    '.error',
+    '.alert-danger',
+    '[class*="error"]',
+    '[role="alert"]'
+])
+
+_LOGIN_OUTCOME_INDICATORS = _SUCCESS_INDICATORS + _ERROR_SELECTORS
+
+# Indicators that the user is already logged in
+_LOGGED_IN_INDICATORS = to_locators([
+    '.user-menu',
+    '.logout',
+    '.dashboard',
+    '[data-testid*="user"]',
+    '.profile',
+    '//a[contains(text(), "Sign Out")]',
+    '//button[contains(text(), "Logout")]'
+])
+
+# Indicators that a login form is showing
+_LOGIN_INDICATORS = to_locators([
+    '#userId',
+    '#email',
+    'input[name="username"]',
+    'input[type="email"]',
+    '//button[contains(text(), "Sign In")]'
+])
+
+_LOGIN_STATE_INDICATORS = _LOGGED_IN_INDICATORS + _LOGIN_INDICATORS
+
+# Sign-in links from config first, then generic fallbacks
+_SIGN_IN_SELECTORS = _LOGIN_CONFIG['sign_in_link'] + to_locators([
+    'a[href*="login"]',
+    '.login-link',
+    '#login-link',
+    '//a[contains(text(), "Login")]',
+    '//a[contains(text(), "log in")]'
+])
+
+_SUBDOMAIN_SELECTORS = _LOGIN_CONFIG['subdomain_selection']
+
+# Pages that can show up before the login form, in the order they are handled
+_PRE_LOGIN_SELECTORS = _SUBDOMAIN_SELECTORS + _SIGN_IN_SELECTORS + _USERNAME_SELECTORS
+
+# Visible text of an element, falling back to its aria-label, in one round-trip
+_ELEMENT_LABEL_SCRIPT = "return arguments[0].innerText.trim() || arguments[0].getAttribute('aria-label');"
+
+# Attributes of the first 10 inputs on the page, gathered in one round-trip
+_INPUT_ATTRIBUTES_SCRIPT = """
+const inputs = Array.from(document.querySelectorAll('input'));
+return {
+    count: inputs.length,
+    attributes: inputs.slice(0, 10).map(e => ({
+        type: e.type, name: e.name, id: e.id, class: e.className, placeholder: e.placeholder
+    }))
+};
+"""
+
 class AuthenticationHandler:
     """Handles MathWorks login and authentication"""
     
@@ -34,75 +149,56 @@ class AuthenticationHandler:
         logger.info("Attempting to login to MathWorks...")
         
         try:
-            # First, check for subdomain selection (region/country selection)
-            # This must happen BEFORE clicking sign-in link
-            if not self.handle_subdomain_selection():
-                logger.warning("Subdomain selection handling failed or not required")
-            
-            # After subdomain selection, check if we need to click the "Sign In" link
-            if not self.click_sign_in_link():
-                logger.warning("Could not find or click sign-in link, checking if already on login page")
+            # A persisted browser profile may already hold a valid session;
+            # check once, as the pre-login probe below already waits
+            if self.is_logged_in(timeout=0):
+                logger.info("Already logged in, skipping login form")
+                return True
             
-            # Give extra time for login form to load
-            logger.info("Waiting for login form to load...")
-            time.sleep(3)  # Extra wait for form to appear
+            # Wait for whichever comes first: the subdomain (region/country)
+            # selection, the "Sign In" link, or the login form itself. The
+            # match is clicked directly, so hidden candidates must not win
+            index, element = self.element_finder.wait_for_first_match(
+                _PRE_LOGIN_SELECTORS, timeout=10, poll_frequency=0.25, visible_only=True
+            )
             
-            # Look for username/email field (first step of login)
-            # Add more comprehensive selectors including class-based ones
-            username_selectors = [
-                'input[name="userId"]',
-                '#userId', 
-                'input[type="email"][name="userId"]',
-                '.form-control[name="userId"]',
-                'input.form-control[name="userId"]',
-                'input[id="userId"]',
-                'input[class*="form-control"][name="userId"]',
-                # Additional fallback selectors
-                'input[type="email"]',
-                'input[name="email"]',
-                'input[placeholder*="email"]',
-                'input[placeholder*="Email"]',
-                '.form-control[type="email"]',
-                Config.SELECTORS['login']['username_field'],
-                '#email',
-                'input[name="username"]'
-            ]
+            if element is None:
+                logger.warning("Could not find subdomain selection or sign-in link, checking if already on login page")
+            elif index < len(_SUBDOMAIN_SELECTORS):
+                # Subdomain selection must happen BEFORE clicking sign-in link
+                if not self.handle_subdomain_selection(element):
+                    logger.warning("Subdomain selection handling failed or not required")
+                
+                if not self.click_sign_in_link():
+                    logger.warning("Could not find or click sign-in link, checking if already on login page")
+            elif index < len(_SUBDOMAIN_SELECTORS) + len(_SIGN_IN_SELECTORS):
+                if not self.click_sign_in_link(element):
+                    logger.warning("Could not click sign-in link, checking if already on login page")
+            else:
+                logger.info("Login form already displayed")
             
-            username_field = self.element_finder.find_element_by_selectors(username_selectors)
+            # Wait for the login form to appear rather than sleeping a fixed time
+            logger.info("Waiting for login form to load...")
+            username_field = self.element_finder.wait_for_any_element(_USERNAME_SELECTORS, timeout=5)
             
             if not username_field:
                 # Debug: Let's see what input fields are actually available
                 logger.warning("Email field not found. Debugging available input fields...")
                 try:
-                    # Check if we're in an iframe
-                    iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-                    if iframes:
-                        logger.info(f"Found {len(iframes)} iframes on page")
-                        # Try switching to the first iframe
-                        try:
-                            self.driver.switch_to.frame(iframes[0])
-                            logger.info("Switched to first iframe")
-                            # Try finding the field again in the iframe
-                            username_field = self.element_finder.find_element_by_selectors(username_selectors)
-                            if username_field:
-                                logger.info("Found email field in iframe!")
-                        except Exception as e:
-                            logger.warning(f"Could not switch to iframe: {e}")
-                            self.driver.switch_to.default_content()
+                    # The form may be rendered inside an iframe, possibly nested
+                    username_field = self.element_finder.find_in_any_iframe(_USERNAME_SELECTORS)
+                    if username_field:
+                        logger.info("Found email field in iframe!")
                     
-                    if not username_field:
-                        all_inputs = self.driver.find_elements(By.TAG_NAME, "input")
-                        logger.info(f"Found {len(all_inputs)} input elements on page")
-                        for i, inp in enumerate(all_inputs[:10]):  # Log first 10 inputs
-                            try:
-                                inp_type = inp.get_attribute('type') or 'text'
-                                inp_name = inp.get_attribute('name') or 'no-name'
-                                inp_id = inp.get_attribute('id') or 'no-id'
-                                inp_class = inp.get_attribute('class') or 'no-class'
-                                inp_placeholder = inp.get_attribute('placeholder') or 'no-placeholder'
-                                logger.info(f"Input {i+1}: type='{inp_type}', name='{inp_name}', id='{inp_id}', class='{inp_class}', placeholder='{inp_placeholder}'")
-                            except Exception:
-                                logger.info(f"Input {i+1}: Could not get attributes")
+                    if not username_field and logger.isEnabledFor(logging.DEBUG):
+                        inputs = self.driver.execute_script(_INPUT_ATTRIBUTES_SCRIPT)
+                        logger.debug(f"Found {inputs['count']} input elements on page")
+                        for i, inp in enumerate(inputs['attributes']):
+                            logger.debug(
+                                f"Input {i+1}: type='{inp['type'] or 'text'}', name='{inp['name'] or 'no-name'}', "
+                                f"id='{inp['id'] or 'no-id'}', class='{inp['class'] or 'no-class'}', "
+                                f"placeholder='{inp['placeholder'] or 'no-placeholder'}'"
+                            )
                 except Exception as e:
                     logger.warning(f"Could not debug input fields: {e}")
                 
@@ -117,14 +213,9 @@ class AuthenticationHandler:
                 return False
             
             # Look for and click the "Next" or "Continue" button for email step
-            email_submit_button = self.element_finder.find_clickable_element_by_selectors([
-                'button[type="submit"]',
-                '//button[contains(text(), "Next")]',
-                '//button[contains(text(), "Continue")]',
-                '//button[contains(text(), "Submit")]',
-                '.btn[type="submit"]',
-                Config.SELECTORS['login']['submit_button']
-            ])
+            email_submit_button = self.element_finder.find_clickable_element_by_selectors(
+                _EMAIL_SUBMIT_SELECTORS
+            )
             
             if email_submit_button:
                 logger.info("Clicking email submit button...")
@@ -138,12 +229,7 @@ class AuthenticationHandler:
                 logger.warning("No email submit button found, attempting to continue...")
             
             # Now look for password field (second step)
-            password_field = self.element_finder.find_element_by_selectors([
-                Config.SELECTORS['login']['password_field'],
-                'input[name="password"]',
-                'input[type="password"]',
-                '#password'
-            ])
+            password_field = self.element_finder.find_element_by_selectors(_PASSWORD_SELECTORS)
             
             if not password_field:
                 logger.error("No password field found after email submission")
@@ -156,14 +242,9 @@ class AuthenticationHandler:
                 return False
             
             # Look for final submit button for password step
-            final_submit_button = self.element_finder.find_clickable_element_by_selectors([
-                'button[type="submit"]',
-                'input[type="submit"]',
-                '//button[contains(text(), "Sign In")]',
-                '//button[contains(text(), "Login")]',
-                '//button[contains(text(), "Submit")]',
-                Config.SELECTORS['login']['submit_button']
-            ])
+            final_submit_button = self.element_finder.find_clickable_element_by_selectors(
+                _FINAL_SUBMIT_SELECTORS
+            )
             
             if not final_submit_button:
                 logger.error("Could not find final login submit button")
@@ -178,88 +259,80 @@ class AuthenticationHandler:
             # Wait for login to complete
             self.action_helper.wait_for_page_load(timeout=10)
             
-            # Check if login was successful by looking for common post-login elements
-            success_indicators = [
-                '.user-menu',
-                '.logout',
-                '.dashboard',
-                '[data-testid*="user"]',
-                '.profile'
-            ]
-            
-            post_login_element = self.element_finder.find_element_by_selectors(
-                success_indicators, timeout=5
-            )
+            # Check for success and error indicators in the same poll
+            logged_in, error_message = self._wait_for_login_outcome(timeout=5)
             
-            if post_login_element:
+            if logged_in:
                 logger.info("Login successful")
                 return True
+            
+            if error_message:
+                logger.error(f"Login failed with error: {error_message}")
             else:
-                # Check for error messages
-                error_selectors = [
-                    '.error',
-                    '.alert-danger',
-                    '[class*="error"]',
-                    '[role="alert"]'
-                ]
-                
-                error_element = self.element_finder.find_element_by_selectors(
-                    error_selectors, timeout=2
-                )
-                
-                if error_element:
-                    error_message = error_element.text
-                    logger.error(f"Login failed with error: {error_message}")
-                else:
-                    logger.warning("Login status unclear - no success or error indicators found")
-                
-                return False
+                logger.warning("Login status unclear - no success or error indicators found")
+            
+            return False
                 
         except Exception as e:
             logger.error(f"Login failed with exception: {e}")
             return False
     
-    def is_logged_in(self):
+    def _wait_for_login_outcome(self, timeout):
         """
-        Check if already logged in
+        Wait for either a post-login indicator or a login error message
         
+        Args:
+            timeout (int): Maximum time to wait
+            
         Returns:
-            bool: Login status
+            tuple: (logged_in, error_message); (False, None) if neither appears
         """
-        try:
-            # Look for indicators that user is logged in
-            logged_in_indicators = [
-                '.user-menu',
-                '.logout',
-                '.dashboard',
-                '[data-testid*="user"]',
-                '.profile',
-                '//a[contains(text(), "Sign Out")]',
-                '//button[contains(text(), "Logout")]'
-            ]
-            
-            element = self.element_finder.find_element_by_selectors(
-                logged_in_indicators, timeout=3
-            )
+        def outcome(driver):
+            match = self.element_finder.find_first_match_js(_LOGIN_OUTCOME_INDICATORS)
+            if not match:
+                return False
             
-            if element:
-                logger.info("User appears to be already logged in")
-                return True
+            index, element = match
+            if index < len(_SUCCESS_INDICATORS):
+                return True, None
             
-            # Look for login form indicators
-            login_indicators = [
-                '#userId',
-                '#email',
-                'input[name="username"]',
-                'input[type="email"]',
-                '//button[contains(text(), "Sign In")]'
-            ]
+            # Empty error containers are often present before anything fails
+            error_message = element.text.strip()
+            return (False, error_message) if error_message else False
+        
+        try:
+            # The page is still navigating after submit, so a matched error
+            # element may be replaced before its text is read; poll again then
+            return WebDriverWait(
+                self.driver, timeout, poll_frequency=0.25,
+                ignored_exceptions=(StaleElementReferenceException,)
+            ).until(outcome)
+        except TimeoutException:
+            return False, None
+    
+    def is_logged_in(self, timeout=3):
+        """
+        Check if already logged in
+        
+        Args:
+            timeout (int): Maximum time to wait for either state, 0 to check once
             
-            login_element = self.element_finder.find_element_by_selectors(
-                login_indicators, timeout=3
+        Returns:
+            bool: Login status
+        """
+        try:
+            # Both states are mutually exclusive, so poll for either at once.
+            # Generic classes such as .profile may sit hidden in the page, so
+            # only rendered elements count
+            index, element = self.element_finder.wait_for_first_match(
+                _LOGIN_STATE_INDICATORS, timeout=timeout, poll_frequency=0.1, visible_only=True
             )
             
-            if login_element:
+            if element is not None:
+                if index < len(_LOGGED_IN_INDICATORS):
+                    logger.info("User appears to be already logged in")
+                    return True
+                
                 logger.info("Login form detected - user not logged in")
                 return False
             
@@ -270,26 +343,21 @@ class AuthenticationHandler:
             logger.error(f"Error checking login status: {e}")
             return False
     
-    def click_sign_in_link(self):
+    def click_sign_in_link(self, sign_in_link=None):
         """
         Click the sign-in anchor tag to navigate to login page
         
+        Args:
+            sign_in_link: Already located sign-in link (optional)
+            
         Returns:
             bool: Success status
         """
         logger.info("Looking for sign-in link...")
         
         try:
-            # Use selectors from config first, then fallbacks
-            all_selectors = Config.SELECTORS['login']['sign_in_link'] + [
-                'a[href*="login"]',
-                '.login-link',
-                '#login-link',
-                '//a[contains(text(), "Login")]',
-                '//a[contains(text(), "log in")]'
-            ]
-            
-            sign_in_link = self.element_finder.find_clickable_element_by_selectors(all_selectors)
+            if sign_in_link is None:
+                sign_in_link = self.element_finder.find_clickable_element_by_selectors(_SIGN_IN_SELECTORS)
             
             if sign_in_link:
                 success = self.action_helper.safe_click(sign_in_link)
@@ -309,11 +377,14 @@ class AuthenticationHandler:
             logger.error(f"Error clicking sign-in link: {e}")
             return False
     
-    def handle_subdomain_selection(self):
+    def handle_subdomain_selection(self, subdomain_button=None):
         """
         Handle MathWorks subdomain/region selection if it appears
         This should be called BEFORE clicking the sign-in link
         
+        Args:
+            subdomain_button: Already located subdomain selection button (optional)
+            
         Returns:
             bool: Success status (True if handled or not needed)
         """
@@ -321,14 +392,17 @@ class AuthenticationHandler:
         
         try:
             # Look for subdomain selection elements using config selectors
-            subdomain_button = self.element_finder.find_clickable_element_by_selectors(
-                Config.SELECTORS['login']['subdomain_selection'], timeout=5
-            )
+            if subdomain_button is None:
+                subdomain_button = self.element_finder.find_clickable_element_by_selectors(
+                    _SUBDOMAIN_SELECTORS, timeout=5
+                )
             
             if subdomain_button:
                 # Get the country/region name for logging
                 try:
-                    country_text = subdomain_button.text or subdomain_button.get_attribute('aria-label') or "Unknown region"
+                    country_text = self.driver.execute_script(
+                        _ELEMENT_LABEL_SCRIPT, subdomain_button
+                    ) or "Unknown region"
                     logger.info(f"Found subdomain selection for: {country_text}")
                 except:
                     logger.info("Found subdomain selection button")
@@ -2,6 +2,8 @@
 Browser setup and management for MathWorks Course Automation
 """
 
+import os
+import socket
 import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -12,12 +14,74 @@ from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Driver path resolved by ChromeDriverManager, reused for later sessions
+_CACHED_DRIVER_PATH = None
+
+# Environment variables that can point at a preinstalled ChromeDriver
+_DRIVER_ENV_VARS = ('CHROMEDRIVER_PATH', 'CHROMEDRIVER')
+
+def _is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+def driver_path_from_env():
+    """
+    Return a preinstalled ChromeDriver named by the environment
+    
+    CHROMEDRIVER_PATH is checked first, then CHROMEDRIVER, which CI images
+    such as GitHub Actions' ubuntu-latest already set.
+    
+    Returns:
+        str: Path to the ChromeDriver executable, or None if neither is set
+    """
+    for name in _DRIVER_ENV_VARS:
+        env_path = os.environ.get(name)
+        if _is_executable(env_path):
+            return env_path
+    return None
+
+def resolve_driver_path():
+    """
+    Resolve the ChromeDriver executable, avoiding repeated downloads
+    
+    A driver named by the environment takes precedence. Otherwise the
+    path installed by ChromeDriverManager is memoized so that only the first
+    session pays for its network check.
+    
+    Returns:
+        str: Path to the ChromeDriver executable
+    """
+    global _CACHED_DRIVER_PATH
+    
+    env_path = driver_path_from_env()
+    if env_path:
+        return env_path
+    
+    if not _is_executable(_CACHED_DRIVER_PATH):
+        _CACHED_DRIVER_PATH = ChromeDriverManager().install()
+        logger.debug(f"Resolved ChromeDriver at: {_CACHED_DRIVER_PATH}")
+    
+    return _CACHED_DRIVER_PATH
+
+def _debugger_reachable(address, timeout=0.5):
+    """Check whether a Chrome remote-debugging endpoint accepts connections"""
+    host, _, port = address.rpartition(':')
+    try:
+        with socket.create_connection((host or '127.0.0.1', int(port)), timeout=timeout):
+            return True
+    except (OSError, ValueError):
+        return False
+
 class BrowserManager:
     """Manages browser setup and configuration"""
     
-    def __init__(self):
+    def __init__(self, isolated=False):
+        # Isolated browsers skip the shared browser and the persistent
+        # profile so that several can run side by side
+        self.isolated = isolated
         self.driver = None
         self.wait = None
+        self.service = None
+        self.attached = False
     
     def setup_chrome_driver(self):
         """
@@ -27,21 +91,59 @@ class BrowserManager:
             tuple: (driver, wait) instances
         """
         try:
+            debugger_address = Config.BROWSER_SETTINGS.get('debugger_address')
+            if Config.BROWSER_SETTINGS.get('reuse_browser') and debugger_address and not self.isolated:
+                if _debugger_reachable(debugger_address):
+                    return self._attach_to_browser(debugger_address)
+                logger.info(f"No browser listening on {debugger_address}, launching a new one")
+            
             # Set up Chrome options
             options = Options()
+            options.page_load_strategy = Config.BROWSER_SETTINGS.get('page_load_strategy', 'normal')
+            
+            # Chrome's own console logging is never read
+            excluded_switches = ["enable-logging"]
             
             # Anti-detection measures
             if Config.BROWSER_SETTINGS['disable_automation_detection']:
                 options.add_argument("--disable-blink-features=AutomationControlled")
-                options.add_experimental_option("excludeSwitches", ["enable-automation"])
+                excluded_switches.append("enable-automation")
                 options.add_experimental_option('useAutomationExtension', False)
             
+            options.add_experimental_option("excludeSwitches", excluded_switches)
+            
             # Performance optimizations
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
             options.add_argument("--disable-extensions")
             
+            # Skip first-run UI and background services that slow down startup
+            options.add_argument("--no-first-run")
+            options.add_argument("--no-default-browser-check")
+            options.add_argument("--disable-default-apps")
+            options.add_argument("--disable-background-networking")
+            options.add_argument("--disable-sync")
+            options.add_argument("--disable-translate")
+            options.add_argument("--disable-features=Translate")
+            options.add_argument("--disable-client-side-phishing-detection")
+            options.add_argument("--disable-component-update")
+            options.add_argument("--metrics-recording-only")
+            options.add_argument("--mute-audio")
+            
+            # Skip image downloads and notification prompts
+            if Config.BROWSER_SETTINGS.get('block_images', True):
+                options.add_argument("--blink-settings=imagesEnabled=false")
+                options.add_experimental_option("prefs", {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2
+                })
+            
+            # Persistent profile keeps session cookies between runs
+            if Config.BROWSER_SETTINGS.get('user_data_dir') and not self.isolated:
+                user_data_dir = os.path.abspath(Config.BROWSER_SETTINGS['user_data_dir'])
+                options.add_argument(f"--user-data-dir={user_data_dir}")
+            
             # Window size
             if Config.BROWSER_SETTINGS['window_size']:
                 width, height = Config.BROWSER_SETTINGS['window_size']
@@ -51,11 +153,11 @@ class BrowserManager:
             if Config.BROWSER_SETTINGS.get('headless', False):
                 options.add_argument("--headless")
             
-            # Set up service
-            service = Service(ChromeDriverManager().install())
+            # Set up service without writing a chromedriver log
+            self.service = Service(resolve_driver_path(), log_output=os.devnull)
             
             # Create driver
-            self.driver = webdriver.Chrome(service=service, options=options)
+            self.driver = webdriver.Chrome(service=self.service, options=options)
             
             # Additional anti-detection
             if Config.BROWSER_SETTINGS['disable_automation_detection']:
@@ -63,26 +165,79 @@ class BrowserManager:
                     "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
                 )
             
-            # Set timeouts
-            self.driver.set_page_load_timeout(Config.BROWSER_SETTINGS['page_load_timeout'])
-            self.driver.implicitly_wait(Config.BROWSER_SETTINGS['implicit_wait'])
-            
-            # Create wait instance
-            self.wait = WebDriverWait(self.driver, Config.BROWSER_SETTINGS['implicit_wait'])
-            
-            logger.info("Chrome WebDriver successfully initialized")
-            return self.driver, self.wait
+            return self._configure_driver()
             
         except Exception as e:
             logger.error(f"Failed to setup Chrome driver: {e}")
             raise
     
+    def _attach_to_browser(self, debugger_address):
+        """
+        Attach to an already running Chrome instead of launching a new one
+        
+        Chrome must have been started with --remote-debugging-port matching
+        the configured debugger address.
+        
+        Args:
+            debugger_address (str): host:port of the remote-debugging endpoint
+            
+        Returns:
+            tuple: (driver, wait) instances
+        """
+        options = Options()
+        options.page_load_strategy = Config.BROWSER_SETTINGS.get('page_load_strategy', 'normal')
+        options.add_experimental_option("debuggerAddress", debugger_address)
+        
+        self.service = Service(resolve_driver_path(), log_output=os.devnull)
+        self.driver = webdriver.Chrome(service=self.service, options=options)
+        self.attached = True
+        
+        logger.info(f"Attached to running Chrome at {debugger_address}")
+        return self._configure_driver()
+    
+    def _configure_driver(self):
+        """
+        Apply timeouts and create the shared wait for the current driver
+        
+        Returns:
+            tuple: (driver, wait) instances
+        """
+        # Set timeouts
+        self.driver.set_page_load_timeout(Config.BROWSER_SETTINGS['page_load_timeout'])
+        
+        # Block fonts, media and trackers that page loads would otherwise wait on
+        blocked_urls = Config.BROWSER_SETTINGS.get('blocked_url_patterns')
+        if blocked_urls:
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
+            except Exception as e:
+                logger.warning(f"Could not block URLs: {e}")
+        
+        # Rely on explicit waits only; an implicit wait stacks on top of
+        # every explicit wait and makes each missed selector block
+        self.driver.implicitly_wait(0)
+        
+        # Create wait instance
+        self.wait = WebDriverWait(
+            self.driver, Config.BROWSER_SETTINGS['implicit_wait'], poll_frequency=0.25
+        )
+        
+        logger.info("Chrome WebDriver successfully initialized")
+        return self.driver, self.wait
+    
     def close_browser(self):
         """Close the browser and clean up resources"""
         if self.driver:
             try:
-                self.driver.quit()
-                logger.info("Browser closed successfully")
+                if self.attached:
+                    # Leave the shared browser running for the next run and
+                    # only stop the chromedriver process we started
+                    self.service.stop()
+                    logger.info("Detached from shared browser")
+                else:
+                    self.driver.quit()
+                    logger.info("Browser closed successfully")
             except Exception as e:
                 logger.error(f"Error closing browser: {e}")
     
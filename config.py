@@ -1,5 +1,8 @@
 # Configuration file for MathWorks Course Automation
 
+from functools import lru_cache
+from selenium.webdriver.common.by import By
+
 class Config:
     """Configuration class for MathWorks automation"""
     
@@ -8,8 +11,19 @@ class Config:
         'headless': False,
         'window_size': (1920, 1080),
         'disable_automation_detection': True,
-        'page_load_timeout': 30,
-        'implicit_wait': 10
+        'page_load_strategy': 'eager',  # Return on DOMContentLoaded instead of window.onload
+        'page_load_timeout': 20,
+        'implicit_wait': 10,  # Timeout of the shared explicit wait; driver implicit waits are disabled
+        'block_images': True,  # Skip image downloads; set False for visual debugging
+        'blocked_url_patterns': [  # Requests never needed for automation, blocked via CDP
+            '*.woff', '*.woff2', '*.ttf', '*.otf',
+            '*.mp4', '*.webm',
+            '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*'
+        ],
+        'user_data_dir': 'chrome_profile',  # Persistent profile so logins survive runs; None for a fresh profile
+        'reuse_browser': False,  # Attach to a Chrome started with --remote-debugging-port instead of launching one
+        'debugger_address': '127.0.0.1:9222',
+        'max_concurrency': 1  # Browsers processing tasks in parallel when each task has its own URL
     }
     
     # Timing settings (in seconds)
@@ -74,6 +88,14 @@ class Config:
                 '[data-testid*="next"]',
                 '.next-button',
                 '.continue-button'
+            ],
+            # Looked up inside the left panel; XPath must stay relative (.//)
+            'solved_indicators': [
+                '[class*="solved"]',
+                '[class*="passed"]',
+                '[class*="completed"]',
+                './/*[contains(text(), "Correct")]',
+                './/*[contains(text(), "Solved")]'
             ]
         },
         
@@ -113,7 +135,8 @@ class Config:
     # Error handling
     ERROR_HANDLING = {
         'max_retries': 3,
-        'retry_delay': 2,
+        'retry_delay': 0.25,  # Delay before the first retry, doubled on each further attempt
+        'retry_max_delay': 2,  # Upper bound for the delay between retries
         'continue_on_error': True,
         'screenshot_on_error': True
     }
@@ -124,3 +147,30 @@ class Config:
         'format': '%(asctime)s - %(levelname)s - %(message)s',
         'file': 'mathworks_automation.log'
     }
+
+@lru_cache(maxsize=256)
+def classify_selector(selector):
+    """
+    Classify a selector string as a (By, value) locator
+    
+    Args:
+        selector (str): CSS selector or XPath expression
+        
+    Returns:
+        tuple: (By, value) locator
+    """
+    if selector.lstrip().startswith(('//', '(', './/')):
+        return (By.XPATH, selector)
+    return (By.CSS_SELECTOR, selector)
+
+# Turn the selector strings into locators once at import time, so lookups
+# never re-classify them: lists become tuples of locators, strings a locator
+for _key, _value in Config.SELECTORS.items():
+    if isinstance(_value, str):
+        Config.SELECTORS[_key] = classify_selector(_value)
+    elif isinstance(_value, dict):
+        for _name, _selectors in _value.items():
+            if isinstance(_selectors, list):
+                _value[_name] = tuple(classify_selector(s) for s in _selectors)
+            elif isinstance(_selectors, str):
+                _value[_name] = classify_selector(_selectors)
@@ -3,8 +3,11 @@ MathWorks Course Automation - Main Entry Point
 Enhanced with modular architecture and improved HTML structure handling
 """
 
+import sys
+import asyncio
+import getpass
 import logging
-import time
+from urllib.parse import urldefrag, urlparse
 from browser_manager import BrowserManager
 from auth_handler import AuthenticationHandler
 from task_automator import MathWorksTaskAutomator
@@ -13,6 +16,27 @@ from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Banner separators, built once
+_SEP_50 = '=' * 50
+_SEP_60 = '=' * 60
+_PROMPT_BANNER = f"\n{_SEP_60}\n🤖 MathWorks Course Automation Tool\n{_SEP_60}\n"
+_SUMMARY_BANNER = f"\n{_SEP_50}\nAUTOMATION SUMMARY\n{_SEP_50}"
+
+# Closing summary line and log level for each course outcome
+_SUMMARY_STATUS = {
+    'complete': (logging.INFO, "🎉 All tasks completed successfully!"),
+    'partial': (logging.INFO, "⚠️ Course partially completed"),
+    'failed': (logging.ERROR, "❌ No tasks were completed successfully")
+}
+
+# URL of the link each task element is or sits in, null when there is none
+_TASK_URLS_SCRIPT = """
+return arguments[0].map(task => {
+    const link = task.closest('a[href]') || task.querySelector('a[href]');
+    return link ? link.href : null;
+});
+"""
+
 class MathWorksAutomator:
     """Main automation orchestrator class"""
     
@@ -38,15 +62,14 @@ class MathWorksAutomator:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize automator: {e}")
+            logger.error("Failed to initialize automator: %s", e)
             return False
     
     def navigate_to_course(self, course_url):
         """Navigate to the course page"""
         try:
-            logger.info(f"Navigating to course: {course_url}")
+            logger.info("Navigating to course: %s", course_url)
             self.driver.get(course_url)
-            time.sleep(Config.TIMING['page_load'])
             
             # Wait for page to be fully loaded
             self.task_automator.action_helper.wait_for_page_load()
@@ -55,7 +78,7 @@ class MathWorksAutomator:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to navigate to course: {e}")
+            logger.error("Failed to navigate to course: %s", e)
             take_screenshot_on_error(self.driver, "navigation_error")
             return False
     
@@ -94,75 +117,292 @@ class MathWorksAutomator:
             # Step 4: Limit number of tasks if specified
             if num_tasks and num_tasks > 0:
                 tasks = tasks[:num_tasks]
-                logger.info(f"Limited to first {num_tasks} tasks")
+                logger.info("Limited to first %s tasks", num_tasks)
+            
+            logger.info("Starting automation for %s tasks", len(tasks))
+            
+            # Step 5: Process each task, in parallel browsers when possible
+            max_concurrency = Config.BROWSER_SETTINGS.get('max_concurrency', 1)
+            task_urls = self._get_task_urls(tasks) if max_concurrency > 1 else None
+            
+            counts = None
+            if task_urls:
+                counts = asyncio.run(
+                    self._process_tasks_parallel(task_urls, username, password, max_concurrency)
+                )
             
-            logger.info(f"Starting automation for {len(tasks)} tasks")
+            if counts is None:
+                counts = self._process_tasks_sequential(tasks)
             
-            # Step 5: Process each task
-            successful_tasks = 0
-            for i, task in enumerate(tasks, 1):
-                logger.info(f"\n{'='*50}")
-                logger.info(f"Processing Task {i} of {len(tasks)}")
-                logger.info(f"{'='*50}")
+            successful_tasks, skipped_tasks = counts
+            attempted_tasks = len(tasks) - skipped_tasks
+            
+            # Step 6: Summary
+            logger.info(_SUMMARY_BANNER)
+            logger.info("Total tasks found: %s", len(tasks))
+            logger.info("Successfully completed: %s", successful_tasks)
+            logger.info("Skipped (already solved): %s", skipped_tasks)
+            logger.info("Failed: %s", attempted_tasks - successful_tasks)
+            if attempted_tasks:
+                logger.info("Success rate: %.1f%%", successful_tasks / attempted_tasks * 100)
+            
+            # Nothing attempted only counts as complete when every task was
+            # confirmed as already solved
+            if successful_tasks == attempted_tasks and (attempted_tasks or skipped_tasks):
+                status = 'complete'
+            elif successful_tasks > 0:
+                status = 'partial'
+            else:
+                status = 'failed'
+            
+            level, message = _SUMMARY_STATUS[status]
+            logger.log(level, message)
+            return status != 'failed'
                 
+        except Exception as e:
+            logger.error("Fatal error during course automation: %s", e)
+            take_screenshot_on_error(self.driver, "fatal_automation_error")
+            return False
+    
+    def _process_tasks_sequential(self, tasks):
+        """
+        Process tasks one after another in the main browser
+        
+        Args:
+            tasks (list): Task WebElements
+            
+        Returns:
+            tuple: (successfully completed, skipped as already solved) task counts
+        """
+        successful_tasks = 0
+        skipped_tasks = 0
+        
+        for i, task in enumerate(tasks, 1):
+            logger.info('\n%s', _SEP_50)
+            logger.info("Processing Task %d of %d", i, len(tasks))
+            logger.info(_SEP_50)
+            
+            try:
+                # Moving on to the next task changes the page, so whether this
+                # task can be clicked is checked at its own turn, in one
+                # round-trip
                 try:
-                    # Click on the task if needed
-                    if task.is_displayed() and task.is_enabled():
-                        try:
-                            self.task_automator.action_helper.safe_click(task)
-                            time.sleep(Config.TIMING['action_delay'])
-                        except Exception:
-                            logger.warning(f"Could not click task {i}, proceeding anyway")
-                    
-                    # Process the task
-                    if self.task_automator.process_single_task(i):
-                        successful_tasks += 1
-                        logger.info(f"✅ Task {i} completed successfully")
-                    else:
-                        logger.error(f"❌ Task {i} failed")
-                        
-                        if not Config.ERROR_HANDLING['continue_on_error']:
-                            logger.error("Stopping automation due to task failure")
-                            break
-                    
-                    # Move to next task (except for the last one)
-                    if i < len(tasks):
-                        if not self.task_automator.move_to_next_task():
-                            logger.warning("Could not move to next task automatically")
-                            # Continue anyway as the next iteration might work
-                
+                    can_click = self.task_automator.element_finder.check_usable([task])[0]
                 except Exception as e:
-                    logger.error(f"Unexpected error in task {i}: {e}")
-                    take_screenshot_on_error(self.driver, f"task_{i}_unexpected_error")
+                    logger.warning("Could not check visibility of task %s: %s", i, e)
+                    can_click = True
+                
+                # Click on the task if needed
+                if can_click:
+                    try:
+                        self.task_automator.action_helper.safe_click(task)
+                        self.task_automator.action_helper.wait_for_animations()
+                    except Exception:
+                        logger.warning("Could not click task %s, proceeding anyway", i)
+                
+                # Process the task
+                result = self.task_automator.process_single_task(i)
+                if result is None:
+                    skipped_tasks += 1
+                    logger.info("⏭️ Task %s already solved", i)
+                elif result:
+                    successful_tasks += 1
+                    logger.info("✅ Task %s completed successfully", i)
+                else:
+                    logger.error("❌ Task %s failed", i)
                     
                     if not Config.ERROR_HANDLING['continue_on_error']:
+                        logger.error("Stopping automation due to task failure")
                         break
                 
-                # Brief pause between tasks
-                time.sleep(Config.TIMING['action_delay'])
+                # Move to next task (except for the last one)
+                if i < len(tasks):
+                    if not self.task_automator.move_to_next_task():
+                        logger.warning("Could not move to next task automatically")
+                        # Continue anyway as the next iteration might work
             
-            # Step 6: Summary
-            logger.info(f"\n{'='*50}")
-            logger.info("AUTOMATION SUMMARY")
-            logger.info(f"{'='*50}")
-            logger.info(f"Total tasks found: {len(tasks)}")
-            logger.info(f"Successfully completed: {successful_tasks}")
-            logger.info(f"Failed: {len(tasks) - successful_tasks}")
-            logger.info(f"Success rate: {(successful_tasks/len(tasks)*100):.1f}%")
-            
-            if successful_tasks == len(tasks):
-                logger.info("🎉 All tasks completed successfully!")
-                return True
-            elif successful_tasks > 0:
-                logger.info("⚠️ Course partially completed")
-                return True
-            else:
-                logger.error("❌ No tasks were completed successfully")
-                return False
+            except Exception as e:
+                logger.error("Unexpected error in task %s: %s", i, e)
+                take_screenshot_on_error(self.driver, f"task_{i}_unexpected_error")
                 
+                if not Config.ERROR_HANDLING['continue_on_error']:
+                    break
+        
+        return successful_tasks, skipped_tasks
+    
+    def _get_task_urls(self, tasks):
+        """
+        Resolve the URL of each task in one script call
+        
+        Args:
+            tasks (list): Task WebElements
+            
+        Tasks only count as URL-indexable when every one links to its own
+        http(s) page; "#" or javascript: links would have every worker open
+        the course page and process the same task.
+        
+        Returns:
+            list: Task URLs, or None if any task cannot be opened by URL
+        """
+        try:
+            urls = self.driver.execute_script(_TASK_URLS_SCRIPT, tasks)
+            course_url = urldefrag(self.driver.current_url).url
         except Exception as e:
-            logger.error(f"Fatal error during course automation: {e}")
-            take_screenshot_on_error(self.driver, "fatal_automation_error")
+            logger.warning("Could not resolve task URLs: %s", e)
+            return None
+        
+        pages = [urldefrag(url).url if url else None for url in urls or []]
+        if (
+            not pages
+            or not all(page and urlparse(page).scheme in ('http', 'https') for page in pages)
+            or len(set(pages)) != len(pages)
+            or course_url in pages
+        ):
+            logger.info("Tasks are not URL-indexable, processing sequentially")
+            return None
+        
+        return urls
+    
+    async def _process_tasks_parallel(self, task_urls, username, password, max_concurrency):
+        """
+        Process URL-indexable tasks across a pool of isolated browsers
+        
+        Each worker browser starts with the session cookies of the main
+        browser, so it normally skips the login form, and then takes tasks
+        from the pool; blocking Selenium calls run in the default executor
+        so the workers progress concurrently.
+        
+        Args:
+            task_urls (list): URL of each task
+            username (str): Username for login
+            password (str): Password for login
+            max_concurrency (int): Maximum number of worker browsers
+            
+        Returns:
+            tuple: (successfully completed, skipped as already solved) task
+            counts, or None if no worker browser could be started
+        """
+        loop = asyncio.get_running_loop()
+        managers = [BrowserManager(isolated=True) for _ in range(min(max_concurrency, len(task_urls)))]
+        pool = asyncio.Queue()
+        cookies = self.driver.get_cookies()
+        
+        # Set on the first failure unless continue_on_error allows going on;
+        # tasks that have not started by then are counted as failed
+        stop = asyncio.Event()
+        
+        try:
+            workers = await asyncio.gather(*(
+                loop.run_in_executor(
+                    None, self._start_worker, manager, task_urls[0], cookies, username, password
+                )
+                for manager in managers
+            ))
+            
+            for worker in workers:
+                if worker:
+                    pool.put_nowait(worker)
+            
+            if pool.empty():
+                logger.error("No worker browser could be started")
+                return None
+            
+            logger.info("Processing %s tasks with %s parallel browsers", len(task_urls), pool.qsize())
+            
+            async def process(task_number, task_url):
+                worker = await pool.get()
+                try:
+                    if stop.is_set():
+                        return False
+                    
+                    result = await loop.run_in_executor(
+                        None, self._process_task_at_url, worker, task_number, task_url
+                    )
+                    if result is False and not Config.ERROR_HANDLING['continue_on_error']:
+                        if not stop.is_set():
+                            logger.error("Stopping automation due to task failure")
+                        stop.set()
+                    return result
+                finally:
+                    pool.put_nowait(worker)
+            
+            results = await asyncio.gather(*(
+                process(i, task_url) for i, task_url in enumerate(task_urls, 1)
+            ))
+            return results.count(True), results.count(None)
+            
+        finally:
+            for manager in managers:
+                manager.close_browser()
+    
+    def _start_worker(self, manager, start_url, cookies, username, password):
+        """
+        Launch a worker browser and carry over the main browser's session
+        
+        Args:
+            manager (BrowserManager): Isolated browser manager for the worker
+            start_url (str): Page to open before logging in
+            cookies (list): Session cookies of the main browser
+            username (str): Username for login if the cookies are not enough
+            password (str): Password for login if the cookies are not enough
+            
+        Returns:
+            MathWorksTaskAutomator or None if the worker could not be started
+        """
+        try:
+            driver, wait = manager.setup_chrome_driver()
+            driver.get(start_url)
+            
+            # Cookies can only be added for the domain of the open page
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except Exception:
+                    logger.debug("Skipped cookie for another domain: %s", cookie.get('domain'))
+            driver.get(start_url)
+            
+            # Logs in only if the copied session was not accepted
+            if not AuthenticationHandler(driver, wait).login(username, password):
+                logger.error("Worker browser failed to log in")
+                return None
+            
+            return MathWorksTaskAutomator(driver, wait)
+            
+        except Exception as e:
+            logger.error("Failed to start worker browser: %s", e)
+            return None
+    
+    def _process_task_at_url(self, worker, task_number, task_url):
+        """
+        Open a task by its URL in a worker browser and process it
+        
+        Args:
+            worker (MathWorksTaskAutomator): Task automator of the worker browser
+            task_number (int): Task number for logging
+            task_url (str): URL of the task
+            
+        Returns:
+            bool: Success status, or None if the task was already solved
+        """
+        try:
+            worker.driver.get(task_url)
+            worker.action_helper.wait_for_page_load()
+            
+            result = worker.process_single_task(task_number)
+            if result is None:
+                logger.info("⏭️ Task %s already solved", task_number)
+                return None
+            
+            if result:
+                logger.info("✅ Task %s completed successfully", task_number)
+                return True
+            
+            logger.error("❌ Task %s failed", task_number)
+            return False
+            
+        except Exception as e:
+            logger.error("Unexpected error in task %s: %s", task_number, e)
+            take_screenshot_on_error(worker.driver, f"task_{task_number}_unexpected_error")
             return False
     
     def cleanup(self):
@@ -183,15 +423,13 @@ class MathWorksAutomator:
         self.cleanup()
         
         if exc_type:
-            logger.error(f"Exception in automator context: {exc_type.__name__}: {exc_val}")
+            logger.error("Exception in automator context: %s: %s", exc_type.__name__, exc_val)
         
         return False  # Don't suppress exceptions
 
 def get_user_input():
     """Get configuration from user input"""
-    print("\n" + "="*60)
-    print("🤖 MathWorks Course Automation Tool")
-    print("="*60)
+    sys.stdout.write(_PROMPT_BANNER)
     
     config = {}
     
@@ -203,12 +441,9 @@ def get_user_input():
     
     # Login credentials - always required now
     print("\n🔐 Login credentials required for MathWorks automation")
-
-    #config['username'] = input("👤 Enter username: ").strip()
-    #config['password'] = input("🔑 Enter password: ").strip()
-
-    config['username'] = 'dmahi@gitam.in'
-    config['password'] = 'LDEq25FxS,bpP9T'
+    
+    config['username'] = input("👤 Enter username: ").strip()
+    config['password'] = getpass.getpass("🔑 Enter password: ").strip()
     
     if not config['username'] or not config['password']:
         print("❌ Both username and password are required!")
@@ -274,7 +509,7 @@ def main():
     except KeyboardInterrupt:
         print(f"\n⏹️ Automation stopped by user (Ctrl+C)")
     except Exception as e:
-        logger.error(f"Unexpected error in main: {e}")
+        logger.error("Unexpected error in main: %s", e)
         print(f"\n❌ An unexpected error occurred: {e}")
         print(f"📄 Check the log file for details: {Config.LOGGING['file']}")
     finally:
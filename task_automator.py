@@ -2,15 +2,60 @@
 Core automation logic for MathWorks Course
 """
 
-import time
 import logging
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from config import Config
-from utils import ElementFinder, ActionHelper, take_screenshot_on_error, retry_on_failure
+from utils import ElementFinder, ActionHelper, take_screenshot_on_error, retry_on_failure, to_locators
 
 logger = logging.getLogger(__name__)
 
+_TASK_NAVIGATION = Config.SELECTORS['task_navigation']
+
+# Fallback: any clickable elements that might be tasks
+_TASK_FALLBACK_SELECTORS = to_locators([
+    "//div[contains(text(), 'Task')]",
+    "//button[contains(@class, 'task')]",
+    "[role='button'][aria-label*='Task']"
+])
+
+# Configured task selectors first, then the fallbacks
+_TASK_SELECTORS = _TASK_NAVIGATION['task_elements'] + _TASK_FALLBACK_SELECTORS
+
+_RIGHT_CONTAINER_SELECTORS = (Config.SELECTORS['right_panel']['container'],) + to_locators([
+    '.mwTabContainer:last-child',
+    '[id*="TabContainer1"]'
+])
+
+_LEFT_CONTAINER_SELECTORS = (Config.SELECTORS['left_panel']['container'],) + to_locators([
+    '.mwTabContainer:first-child',
+    '[id*="TabContainer0"]'
+])
+
+# Solution code inside the right panel, matching the structure of the HTML
+_SOLUTION_CONTENT_SELECTORS = to_locators([
+    '.textBox .textWrapper',  # Based on your original example
+    '.textBox',
+    'code',
+    'pre',
+    '.matlab-code',
+    '[class*="code"]',
+    '.editorWindow .rtcPlaceholder',
+    '.MultiViewRTC'
+])
+
+# Editor elements inside the left panel
+_EDITOR_SELECTORS = to_locators([
+    'textarea',
+    '.CodeMirror textarea',
+    '.monaco-editor textarea',
+    '[contenteditable="true"]',
+    'input[type="text"]',
+    '.editor textarea',
+    '.rtcPlaceholder textarea'
+])
+
 class MathWorksTaskAutomator:
     """Handles individual task automation logic"""
     
@@ -19,6 +64,32 @@ class MathWorksTaskAutomator:
         self.wait = wait
         self.element_finder = ElementFinder(driver, wait)
         self.action_helper = ActionHelper(driver, self.element_finder)
+        
+        # Panel containers, located once per task
+        self._left_container = None
+        self._right_container = None
+        
+        # Right panel text before "See Solution" was clicked, so the wait for
+        # the solution does not end on text that was already there
+        self._right_panel_text = ""
+    
+    def _get_right_container(self, refresh=False):
+        """Return the right panel container, locating it only when not cached"""
+        if refresh or not self._right_container:
+            self._right_container = self.element_finder.find_element_by_selectors(_RIGHT_CONTAINER_SELECTORS)
+        return self._right_container
+    
+    def _get_left_container(self, refresh=False):
+        """Return the left panel container, locating it only when not cached"""
+        if refresh or not self._left_container:
+            self._left_container = self.element_finder.find_element_by_selectors(_LEFT_CONTAINER_SELECTORS)
+        return self._left_container
+    
+    def _reset_panel_cache(self):
+        """Forget the panel containers once the page moves on to another task"""
+        self._left_container = None
+        self._right_container = None
+        self._right_panel_text = ""
     
     def find_tasks(self):
         """
@@ -29,23 +100,21 @@ class MathWorksTaskAutomator:
         """
         logger.info("Searching for task elements...")
         
-        tasks = self.element_finder.find_multiple_elements_by_selectors(
-            Config.SELECTORS['task_navigation']['task_elements']
-        )
-        
-        if not tasks:
-            # Fallback: look for any clickable elements that might be tasks
-            fallback_selectors = [
-                "//div[contains(text(), 'Task')]",
-                "//button[contains(@class, 'task')]",
-                "[role='button'][aria-label*='Task']"
-            ]
-            tasks = self.element_finder.find_multiple_elements_by_selectors(fallback_selectors)
+        # Wait for the task list to render and collect the matches of the
+        # first selector that finds any, one script call per poll
+        try:
+            index, tasks = WebDriverWait(
+                self.driver, Config.BROWSER_SETTINGS['implicit_wait'], poll_frequency=0.25
+            ).until(lambda driver: self.element_finder.find_all_first_match_js(_TASK_SELECTORS))
+            logger.debug("Found tasks using selector: %s", _TASK_SELECTORS[index][1])
+        except TimeoutException:
+            logger.warning("Could not find elements using any of the selectors: %s", _TASK_SELECTORS)
+            tasks = []
         
-        logger.info(f"Found {len(tasks)} task elements")
+        logger.info("Found %s task elements", len(tasks))
         return tasks
     
-    @retry_on_failure
+    @retry_on_failure()
     def click_see_solution(self):
         """
         Click the 'See Solution' button
@@ -56,14 +125,19 @@ class MathWorksTaskAutomator:
         logger.info("Looking for 'See Solution' button...")
         
         button = self.element_finder.find_clickable_element_by_selectors(
-            Config.SELECTORS['task_navigation']['see_solution_button']
+            _TASK_NAVIGATION['see_solution_button']
         )
         
         if button:
+            # Snapshot the right panel so the wait below can tell the
+            # solution apart from what the panel showed before the click
+            right_container = self._get_right_container()
+            self._right_panel_text = self._read_panel_text(right_container)
+            
             success = self.action_helper.safe_click(button)
             if success:
                 logger.info("Successfully clicked 'See Solution' button")
-                time.sleep(Config.TIMING['action_delay'])
+                self._wait_for_solution(right_container)
                 return True
         
         logger.warning("Could not find or click 'See Solution' button")
@@ -79,51 +153,44 @@ class MathWorksTaskAutomator:
         logger.info("Extracting solution from right panel...")
         
         try:
-            # Wait for the right panel to load
-            time.sleep(Config.TIMING['element_wait'])
-            
             # Look for the right panel container first
-            right_container = self.element_finder.find_element_by_selectors([
-                Config.SELECTORS['right_panel']['container'],
-                '.mwTabContainer:last-child',
-                '[id*="TabContainer1"]'
-            ])
+            right_container = self._get_right_container()
             
             if not right_container:
                 logger.warning("Could not find right panel container")
                 return ""
             
-            # Look for solution content within the right panel
-            solution_elements = []
+            # Wait for the solution text to render in the right panel
+            try:
+                try:
+                    self._wait_for_panel_text(right_container)
+                except StaleElementReferenceException:
+                    logger.debug("Right panel container went stale, locating it again")
+                    right_container = self._get_right_container(refresh=True)
+                    if not right_container:
+                        logger.warning("Could not find right panel container")
+                        return ""
+                    self._wait_for_panel_text(right_container)
+            except TimeoutException:
+                logger.debug("Right panel text did not appear in time")
             
-            # Try to find elements with the specific structure from the HTML
-            selectors_to_try = [
-                '.textBox .textWrapper',  # Based on your original example
-                '.textBox',
-                'code',
-                'pre',
-                '.matlab-code',
-                '[class*="code"]',
-                '.editorWindow .rtcPlaceholder',
-                '.MultiViewRTC'
-            ]
+            # Look for solution content within the right panel, trying the
+            # selectors in priority order in a single round-trip
+            solution_elements = []
+            match = self.element_finder.find_all_first_match_js(
+                _SOLUTION_CONTENT_SELECTORS, root=right_container
+            )
             
-            for selector in selectors_to_try:
-                try:
-                    elements = right_container.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        solution_elements = elements
-                        logger.debug(f"Found solution elements using selector: {selector}")
-                        break
-                except Exception:
-                    continue
+            if match:
+                index, solution_elements = match
+                logger.debug("Found solution elements using selector: %s", _SOLUTION_CONTENT_SELECTORS[index][1])
             
             # Extract text from found elements
             if solution_elements:
                 solution_code = self.action_helper.extract_text_from_elements(solution_elements)
                 
                 if solution_code:
-                    logger.info(f"Successfully extracted solution: {solution_code[:100]}...")
+                    logger.info("Successfully extracted solution: %s...", solution_code[:100])
                     return solution_code
             
             # Fallback: get all text from the right panel
@@ -139,11 +206,51 @@ class MathWorksTaskAutomator:
             return ""
             
         except Exception as e:
-            logger.error(f"Error extracting solution: {e}")
+            logger.error("Error extracting solution: %s", e)
             take_screenshot_on_error(self.driver, "solution_extraction_error")
             return ""
     
-    @retry_on_failure
+    def _read_panel_text(self, container):
+        """Return the text of a panel container, or "" if it is missing or gone"""
+        if not container:
+            return ""
+        try:
+            return container.text.strip()
+        except StaleElementReferenceException:
+            return ""
+    
+    def _panel_text_changed(self, container):
+        """Check whether the container shows text it did not have before the click"""
+        text = container.text.strip()
+        return bool(text) and text != self._right_panel_text
+    
+    def _wait_for_panel_text(self, container):
+        """Wait until the container shows new, non-empty text"""
+        WebDriverWait(self.driver, Config.TIMING['element_wait'], poll_frequency=0.1).until(
+            lambda driver: self._panel_text_changed(container)
+        )
+    
+    def _wait_for_solution(self, container):
+        """
+        Wait until "See Solution" took effect in the right panel
+        
+        The panel either gets replaced, or its text changes from the
+        snapshot taken before the click.
+        """
+        if not container:
+            return
+        
+        try:
+            WebDriverWait(self.driver, Config.TIMING['element_wait'], poll_frequency=0.1).until(
+                EC.any_of(
+                    EC.staleness_of(container),
+                    lambda driver: self._panel_text_changed(container)
+                )
+            )
+        except TimeoutException:
+            logger.debug("Right panel did not change after clicking 'See Solution'")
+    
+    @retry_on_failure()
     def paste_solution_to_left_panel(self, solution_code):
         """
         Paste solution code into the left panel editor
@@ -158,60 +265,65 @@ class MathWorksTaskAutomator:
         
         try:
             # Find the left panel container
-            left_container = self.element_finder.find_element_by_selectors([
-                Config.SELECTORS['left_panel']['container'],
-                '.mwTabContainer:first-child',
-                '[id*="TabContainer0"]'
-            ])
+            left_container = self._get_left_container()
             
             if not left_container:
                 logger.warning("Could not find left panel container")
                 return False
             
-            # Look for editor elements within the left panel
-            editor_selectors = [
-                'textarea',
-                '.CodeMirror textarea',
-                '.monaco-editor textarea',
-                '[contenteditable="true"]',
-                'input[type="text"]',
-                '.editor textarea',
-                '.rtcPlaceholder textarea'
-            ]
-            
+            # Look for the first displayed, enabled editor within the left
+            # panel, checking every selector in a single round-trip
             editor = None
-            for selector in editor_selectors:
-                try:
-                    elements = left_container.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            editor = element
-                            break
-                    if editor:
-                        break
-                except Exception:
-                    continue
+            try:
+                match = self.element_finder.find_all_first_match_js(
+                    _EDITOR_SELECTORS, root=left_container, visible_only=True
+                )
+            except StaleElementReferenceException:
+                logger.debug("Left panel container went stale, locating it again")
+                left_container = self._get_left_container(refresh=True)
+                if not left_container:
+                    logger.warning("Could not find left panel container")
+                    return False
+                match = self.element_finder.find_all_first_match_js(
+                    _EDITOR_SELECTORS, root=left_container, visible_only=True
+                )
+            
+            if match:
+                editor = match[1][0]
             
             if not editor:
                 logger.warning("Could not find editor element in left panel")
                 return False
             
-            # Paste the solution
+            # Paste the solution directly, typing it only as a fallback when
+            # the editor did not take the value
+            if self.action_helper.set_editor_value(editor, solution_code):
+                logger.info("Successfully pasted solution to left panel")
+                return True
+            
             success = self.action_helper.safe_send_keys(editor, solution_code, clear_first=True)
             
             if success:
                 logger.info("Successfully pasted solution to left panel")
-                time.sleep(Config.TIMING['action_delay'])
+                
+                # Wait for the editor to hold the typed code
+                try:
+                    WebDriverWait(self.driver, Config.TIMING['action_delay'], poll_frequency=0.1).until(
+                        lambda driver: self.action_helper.get_editor_value(editor) == solution_code
+                    )
+                except TimeoutException:
+                    logger.debug("Editor content did not match pasted code in time")
+                
                 return True
             
             return False
             
         except Exception as e:
-            logger.error(f"Error pasting solution: {e}")
+            logger.error("Error pasting solution: %s", e)
             take_screenshot_on_error(self.driver, "solution_paste_error")
             return False
     
-    @retry_on_failure
+    @retry_on_failure()
     def submit_solution(self):
         """
         Submit the solution
@@ -222,20 +334,29 @@ class MathWorksTaskAutomator:
         logger.info("Submitting solution...")
         
         button = self.element_finder.find_clickable_element_by_selectors(
-            Config.SELECTORS['task_navigation']['submit_button']
+            _TASK_NAVIGATION['submit_button']
         )
         
         if button:
+            # A "Next" button shown before submitting is not a sign that the
+            # submission went through
+            next_button = self.element_finder.find_element_js(_TASK_NAVIGATION['next_task_button'])
+            
             success = self.action_helper.safe_click(button)
             if success:
                 logger.info("Successfully submitted solution")
-                time.sleep(Config.TIMING['submit_wait'])
+                self.action_helper.wait_until_settled(
+                    button,
+                    _TASK_NAVIGATION['next_task_button'],
+                    timeout=Config.TIMING['submit_wait'],
+                    prev_match=next_button
+                )
                 return True
         
         logger.warning("Could not find or click submit button")
         return False
     
-    @retry_on_failure
+    @retry_on_failure()
     def move_to_next_task(self):
         """
         Move to the next task
@@ -246,19 +367,43 @@ class MathWorksTaskAutomator:
         logger.info("Moving to next task...")
         
         button = self.element_finder.find_clickable_element_by_selectors(
-            Config.SELECTORS['task_navigation']['next_task_button']
+            _TASK_NAVIGATION['next_task_button']
         )
         
         if button:
+            # The current task's "See Solution" button must not be mistaken
+            # for the next task's
+            see_solution = self.element_finder.find_element_js(_TASK_NAVIGATION['see_solution_button'])
+            
             success = self.action_helper.safe_click(button)
             if success:
                 logger.info("Successfully moved to next task")
-                time.sleep(Config.TIMING['task_transition'])
+                self._reset_panel_cache()
+                self.action_helper.wait_until_settled(
+                    button,
+                    _TASK_NAVIGATION['see_solution_button'],
+                    timeout=Config.TIMING['task_transition'],
+                    prev_match=see_solution
+                )
+                self.action_helper.wait_for_animations()
                 return True
         
         logger.warning("Could not find or click next task button")
         return False
     
+    def _is_task_solved(self):
+        """Check whether the left panel shows a visible solved indicator"""
+        left_container = self._get_left_container()
+        if not left_container:
+            return False
+        
+        try:
+            return bool(self.element_finder.find_all_first_match_js(
+                _TASK_NAVIGATION['solved_indicators'], root=left_container, visible_only=True
+            ))
+        except StaleElementReferenceException:
+            return False
+    
     def process_single_task(self, task_number):
         """
         Process a single task completely
@@ -267,36 +412,54 @@ class MathWorksTaskAutomator:
             task_number (int): Task number for logging
             
         Returns:
-            bool: Success status
+            bool: Success status, or None if the task was already solved
         """
-        logger.info(f"--- Processing Task {task_number} ---")
+        logger.info("--- Processing Task %s ---", task_number)
+        
+        # Containers from a previous task may no longer be in the page
+        self._reset_panel_cache()
         
         try:
+            # Solved tasks have no "See Solution" button; skip them rather
+            # than failing the whole see/extract/paste/submit sequence. A
+            # missing button alone may just be a slow render or a broken
+            # selector, so a task is only skipped when it shows as solved
+            _, see_solution = self.element_finder.wait_for_first_match(
+                _TASK_NAVIGATION['see_solution_button'], timeout=Config.TIMING['element_wait']
+            )
+            if see_solution is None:
+                if self._is_task_solved():
+                    logger.info("Task %s: Already solved, skipping", task_number)
+                    return None
+                
+                logger.error("Task %s: Could not find 'See Solution' button", task_number)
+                return False
+            
             # Step 1: Click "See Solution"
             if not self.click_see_solution():
-                logger.error(f"Task {task_number}: Failed to click 'See Solution'")
+                logger.error("Task %s: Failed to click 'See Solution'", task_number)
                 return False
             
             # Step 2: Extract solution from right panel
             solution_code = self.extract_solution_from_right_panel()
             if not solution_code:
-                logger.error(f"Task {task_number}: Failed to extract solution")
+                logger.error("Task %s: Failed to extract solution", task_number)
                 return False
             
             # Step 3: Paste solution to left panel
             if not self.paste_solution_to_left_panel(solution_code):
-                logger.error(f"Task {task_number}: Failed to paste solution")
+                logger.error("Task %s: Failed to paste solution", task_number)
                 return False
             
             # Step 4: Submit solution
             if not self.submit_solution():
-                logger.warning(f"Task {task_number}: Could not submit solution")
+                logger.warning("Task %s: Could not submit solution", task_number)
                 # Continue anyway as submission might not always be required
             
-            logger.info(f"Task {task_number}: Completed successfully")
+            logger.info("Task %s: Completed successfully", task_number)
             return True
             
         except Exception as e:
-            logger.error(f"Task {task_number}: Unexpected error - {e}")
+            logger.error("Task %s: Unexpected error - %s", task_number, e)
             take_screenshot_on_error(self.driver, f"task_{task_number}_error")
             return False
@@ -3,58 +3,327 @@ Utility functions for MathWorks Course Automation
 """
 
 import time
+import queue
+import atexit
+import random
 import logging
+import logging.handlers
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from config import Config
+from config import Config, classify_selector
+
+# Set up logging; records are formatted by the queue handler and written
+# by a background listener thread, so file and console I/O stays off the
+# WebDriver action path
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler(Config.LOGGING['file']),
+    logging.StreamHandler()
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-# Set up logging
 logging.basicConfig(
     level=getattr(logging, Config.LOGGING['level']),
     format=Config.LOGGING['format'],
-    handlers=[
-        logging.FileHandler(Config.LOGGING['file']),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# Timing settings read on every element lookup and click
+_ELEMENT_WAIT = Config.TIMING['element_wait']
+_ACTION_DELAY = Config.TIMING['action_delay']
+_PAGE_LOAD = Config.TIMING['page_load']
+_EAGER_PAGE_LOAD = Config.BROWSER_SETTINGS.get('page_load_strategy') == 'eager'
+
+# Resolve a list of [by, value] locators in the browser and return
+# [index, element] for the first match, so probing N selectors costs one
+# WebDriver round-trip
+_FIRST_MATCH_SCRIPT = """
+const locators = arguments[0];
+for (let i = 0; i < locators.length; i++) {
+    const [by, value] = locators[i];
+    let element = null;
+    try {
+        element = by === 'xpath'
+            ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(value);
+    } catch (e) {
+        continue;
+    }
+    if (element) {
+        return [i, element];
+    }
+}
+return null;
+"""
+
+# Same as _FIRST_MATCH_SCRIPT but scoped to a root element and returning
+# [index, elements] with every element the first matching locator finds,
+# optionally keeping only rendered, enabled elements
+_ALL_MATCHES_SCRIPT = """
+const root = arguments[0] || document;
+const locators = arguments[1];
+const visibleOnly = arguments[2];
+const usable = el => el.getClientRects().length > 0
+    && !el.disabled
+    && getComputedStyle(el).visibility !== 'hidden';
+for (let i = 0; i < locators.length; i++) {
+    const [by, value] = locators[i];
+    let elements = [];
+    try {
+        if (by === 'xpath') {
+            const result = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let j = 0; j < result.snapshotLength; j++) {
+                elements.push(result.snapshotItem(j));
+            }
+        } else {
+            elements = Array.from(root.querySelectorAll(value));
+        }
+    } catch (e) {
+        continue;
+    }
+    if (visibleOnly) {
+        elements = elements.filter(usable);
+    }
+    if (elements.length) {
+        return [i, elements];
+    }
+}
+return null;
+"""
+
+# Search same-origin iframes at any depth for the first matching locator.
+# Returns {match: [iframe index path, locator index] or null, blocked: [paths
+# of cross-origin iframes whose documents could not be searched]}
+_IFRAME_MATCH_SCRIPT = """
+const locators = arguments[0];
+function matchIn(doc) {
+    for (let i = 0; i < locators.length; i++) {
+        const [by, value] = locators[i];
+        try {
+            const element = by === 'xpath'
+                ? doc.evaluate(value, doc, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                : doc.querySelector(value);
+            if (element) {
+                return i;
+            }
+        } catch (e) {}
+    }
+    return -1;
+}
+const blocked = [];
+function search(doc, path) {
+    const frames = doc.querySelectorAll('iframe');
+    for (let f = 0; f < frames.length; f++) {
+        const framePath = path.concat([f]);
+        let child = null;
+        try {
+            child = frames[f].contentDocument;
+        } catch (e) {}
+        if (!child) {
+            blocked.push(framePath);
+            continue;
+        }
+        const index = matchIn(child);
+        if (index >= 0) {
+            return [framePath, index];
+        }
+        const nested = search(child, framePath);
+        if (nested) {
+            return nested;
+        }
+    }
+    return null;
+}
+return {match: search(document, []), blocked: blocked};
+"""
+
+# Trimmed rendered text of each element in arguments[0]
+_ELEMENT_TEXTS_SCRIPT = """
+return arguments[0].map(e => (e.innerText || e.textContent || '').trim());
+"""
+
+# True once the element sits fully inside the viewport
+_IN_VIEWPORT_SCRIPT = """
+const r = arguments[0].getBoundingClientRect();
+return r.top >= 0 && r.bottom <= window.innerHeight;
+"""
+
+# Scroll an element to the middle of the viewport and click it in one
+# WebDriver round-trip
+_SCROLL_AND_CLICK_SCRIPT = """
+const element = arguments[0];
+element.scrollIntoView({block: 'center'});
+element.click();
+"""
+
+# Whether each element in arguments[0] is rendered and enabled, using the
+# same test as the visible_only filter of _ALL_MATCHES_SCRIPT
+_USABLE_ELEMENTS_SCRIPT = """
+return arguments[0].map(el => el.getClientRects().length > 0
+    && !el.disabled
+    && getComputedStyle(el).visibility !== 'hidden');
+"""
+
+# Replace an editor's content in one call: through the CodeMirror or Monaco
+# API when the element belongs to one, otherwise by setting the value (or
+# text of a contenteditable) and firing the events a user edit would
+_SET_EDITOR_VALUE_SCRIPT = """
+const el = arguments[0];
+const text = arguments[1];
+const codeMirror = el.closest('.CodeMirror');
+if (codeMirror && codeMirror.CodeMirror) {
+    codeMirror.CodeMirror.setValue(text);
+    return 'codemirror';
+}
+if (window.monaco && el.closest('.monaco-editor')) {
+    const editor = monaco.editor.getEditors().find(ed => ed.getContainerDomNode().contains(el));
+    if (editor) {
+        editor.setValue(text);
+        return 'monaco';
+    }
+}
+el.focus();
+if (el.isContentEditable) {
+    el.textContent = text;
+} else {
+    el.value = text;
+}
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return 'value';
+"""
+
+# Current content of an editor element: the CodeMirror or Monaco model it
+# belongs to, otherwise its value or, for contenteditable, its text
+_GET_EDITOR_VALUE_SCRIPT = """
+const el = arguments[0];
+const codeMirror = el.closest('.CodeMirror');
+if (codeMirror && codeMirror.CodeMirror) {
+    return codeMirror.CodeMirror.getValue();
+}
+if (window.monaco && el.closest('.monaco-editor')) {
+    const editor = monaco.editor.getEditors().find(ed => ed.getContainerDomNode().contains(el));
+    if (editor) {
+        return editor.getValue();
+    }
+}
+return el.isContentEditable ? el.textContent : el.value;
+"""
+
+# True once no CSS animation or transition is still running
+_ANIMATIONS_DONE_SCRIPT = """
+if (!document.getAnimations) {
+    return true;
+}
+return document.getAnimations().every(a => a.playState !== 'running');
+"""
+
+def to_locator(selector):
+    """
+    Classify a selector as a (By, value) locator
+    
+    Args:
+        selector: CSS selector, XPath expression, or an existing locator tuple
+        
+    Returns:
+        tuple: (By, value) locator
+    """
+    if isinstance(selector, tuple):
+        return selector
+    return classify_selector(selector)
+
+def to_locators(selectors):
+    """
+    Classify a list of selectors once so lookups can reuse the locators
+    
+    Args:
+        selectors (list): List of CSS selectors or XPath expressions
+        
+    Returns:
+        tuple: (By, value) locators
+    """
+    return tuple(to_locator(selector) for selector in selectors)
+
+def _matched_locator(locator, condition):
+    """Wrap an expected condition so that a match also reports its locator"""
+    def check(driver):
+        element = condition(driver)
+        return (locator, element) if element else False
+    return check
+
+# Expected conditions only close over their locator, so the same callable
+# can be reused by every lookup of a recurring selector
+@functools.lru_cache(maxsize=512)
+def _presence(locator):
+    """Return the cached presence condition for a locator"""
+    return EC.presence_of_element_located(locator)
+
+@functools.lru_cache(maxsize=512)
+def _clickable(locator):
+    """Return the cached clickable condition for a locator, reporting the locator on a match"""
+    return _matched_locator(locator, EC.element_to_be_clickable(locator))
+
 class ElementFinder:
     """Utility class for finding elements with multiple selector strategies"""
     
     def __init__(self, driver, wait):
         self.driver = driver
         self.wait = wait
+        
+        # Locator of the last clickable hit for each selector group
+        self._last_hit = {}
+        
+        # WebDriverWait instances keyed by (timeout, poll frequency)
+        self._waits = {}
+    
+    def _get_wait(self, timeout, poll_frequency=0.5):
+        """Return a reusable WebDriverWait for the given timeout and poll frequency"""
+        key = (timeout, poll_frequency)
+        wait = self._waits.get(key)
+        if wait is None:
+            wait = self._waits[key] = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+        return wait
     
     def find_element_by_selectors(self, selectors, timeout=None):
         """
         Try multiple selectors to find an element
         
         Args:
-            selectors (list): List of CSS selectors or XPath expressions
-            timeout (int): Custom timeout for this search
+            selectors (list): List of CSS selectors, XPath expressions or locators
+            timeout (int): Custom timeout for this search, 0 to check once
             
         Returns:
             WebElement or None
         """
-        wait_time = timeout or Config.TIMING['element_wait']
+        wait_time = _ELEMENT_WAIT if timeout is None else timeout
         
-        for selector in selectors:
-            try:
-                if selector.startswith('//'):
-                    element = WebDriverWait(self.driver, wait_time).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                else:
-                    element = WebDriverWait(self.driver, wait_time).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                logger.debug(f"Found element using selector: {selector}")
-                return element
-            except TimeoutException:
-                continue
+        # Without a timeout a single look is enough; find_elements reports a
+        # miss as an empty list, so no wait loop or exception is involved
+        if wait_time <= 0:
+            for by, value in map(to_locator, selectors):
+                elements = self.driver.find_elements(by, value)
+                if elements:
+                    logger.debug(f"Found element using selector: {value}")
+                    return elements[0]
+            
+            logger.warning(f"Could not find element using any of the selectors: {selectors}")
+            return None
+        
+        # Poll every selector on each tick instead of waiting out each in turn
+        conditions = [_presence(locator) for locator in map(to_locator, selectors)]
+        try:
+            element = self._get_wait(wait_time).until(EC.any_of(*conditions))
+            logger.debug(f"Found element using one of {len(conditions)} selectors")
+            return element
+        except TimeoutException:
+            pass
         
         logger.warning(f"Could not find element using any of the selectors: {selectors}")
         return None
@@ -64,57 +333,189 @@ class ElementFinder:
         Try multiple selectors to find a clickable element
         
         Args:
-            selectors (list): List of CSS selectors or XPath expressions
-            timeout (int): Custom timeout for this search
+            selectors (list): List of CSS selectors, XPath expressions or locators
+            timeout (int): Custom timeout for this search, 0 to check once
             
         Returns:
             WebElement or None
         """
-        wait_time = timeout or Config.TIMING['element_wait']
+        wait_time = _ELEMENT_WAIT if timeout is None else timeout
+        group = locators = to_locators(selectors)
         
-        for selector in selectors:
-            try:
-                if selector.startswith('//'):
-                    element = WebDriverWait(self.driver, wait_time).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                else:
-                    element = WebDriverWait(self.driver, wait_time).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                logger.debug(f"Found clickable element using selector: {selector}")
-                return element
-            except TimeoutException:
-                continue
+        # The selector that worked last time for this group usually works
+        # again, so check it first on each tick
+        last_hit = self._last_hit.get(group)
+        if last_hit is not None:
+            locators = (last_hit,) + tuple(locator for locator in group if locator != last_hit)
+        
+        # Poll every selector on each tick instead of waiting out each in turn
+        conditions = [_clickable(locator) for locator in locators]
+        try:
+            locator, element = self._get_wait(wait_time).until(EC.any_of(*conditions))
+            self._last_hit[group] = locator
+            logger.debug(f"Found clickable element using selector: {locator[1]}")
+            return element
+        except TimeoutException:
+            pass
         
         logger.warning(f"Could not find clickable element using any of the selectors: {selectors}")
         return None
     
-    def find_multiple_elements_by_selectors(self, selectors):
+    def wait_for_any_element(self, selectors, timeout=None, poll_frequency=0.25):
         """
-        Try multiple selectors to find multiple elements
+        Wait until any of the selectors matches an element
+        
+        All selectors are polled together, so the wait returns as soon as
+        any one of them appears instead of timing out on each in turn.
         
         Args:
-            selectors (list): List of CSS selectors or XPath expressions
+            selectors (list): List of CSS selectors, XPath expressions or locators
+            timeout (int): Custom timeout for this search, 0 to check once
+            poll_frequency (float): Seconds between polls
+        
+        Returns:
+            WebElement or None
+        """
+        _, element = self.wait_for_first_match(selectors, timeout, poll_frequency)
+        return element
+    
+    def wait_for_first_match(self, selectors, timeout=None, poll_frequency=0.25, visible_only=False):
+        """
+        Wait until any of the selectors matches and report which one did
+        
+        Args:
+            selectors (list): List of CSS selectors, XPath expressions or locators
+            timeout (int): Custom timeout for this search, 0 to check once
+            poll_frequency (float): Seconds between polls
+            visible_only (bool): Only match rendered, enabled elements
             
         Returns:
-            List of WebElements
+            tuple: (index of the matching selector, WebElement) or (None, None)
         """
-        for selector in selectors:
-            try:
-                if selector.startswith('//'):
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                else:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                if elements:
-                    logger.debug(f"Found {len(elements)} elements using selector: {selector}")
-                    return elements
-            except Exception:
-                continue
+        wait_time = _ELEMENT_WAIT if timeout is None else timeout
+        
+        if visible_only:
+            def probe(driver):
+                match = self.find_all_first_match_js(selectors, visible_only=True)
+                return (match[0], match[1][0]) if match else None
+        else:
+            def probe(driver):
+                return self.find_first_match_js(selectors)
+        
+        try:
+            return self._get_wait(wait_time, poll_frequency).until(probe)
+        except TimeoutException:
+            logger.debug(f"No element appeared within {wait_time}s for selectors: {selectors}")
+            return None, None
+    
+    def find_element_js(self, selectors):
+        """
+        Find the first element matching any selector in a single script call
+        
+        Args:
+            selectors (list): List of CSS selectors, XPath expressions or locators
+            
+        Returns:
+            WebElement or None
+        """
+        match = self.find_first_match_js(selectors)
+        return match[1] if match else None
+    
+    def find_first_match_js(self, selectors):
+        """
+        Find the first matching selector and its element in a single script call
+        
+        Args:
+            selectors (list): List of CSS selectors, XPath expressions or locators
+            
+        Returns:
+            tuple: (index of the matching selector, WebElement) or None
+        """
+        locators = [list(to_locator(selector)) for selector in selectors]
+        match = self.driver.execute_script(_FIRST_MATCH_SCRIPT, locators)
+        return tuple(match) if match else None
+    
+    def find_all_first_match_js(self, selectors, root=None, visible_only=False):
+        """
+        Find every element of the first selector with any match in one script call
         
-        logger.warning(f"Could not find elements using any of the selectors: {selectors}")
-        return []
+        Selector priority is preserved, unlike a single compound selector
+        which returns its matches in document order.
+        
+        Args:
+            selectors (list): List of CSS selectors, XPath expressions or locators
+            root: WebElement to search within (defaults to the whole document)
+            visible_only (bool): Only keep rendered, enabled elements
+            
+        Returns:
+            tuple: (index of the matching selector, list of WebElements) or None
+        """
+        locators = [list(to_locator(selector)) for selector in selectors]
+        match = self.driver.execute_script(_ALL_MATCHES_SCRIPT, root, locators, visible_only)
+        return tuple(match) if match else None
+    
+    def check_usable(self, elements):
+        """
+        Check which elements are displayed and enabled in a single script call
+        
+        Args:
+            elements (list): WebElements to check
+            
+        Returns:
+            list: One bool per element
+        """
+        if not elements:
+            return []
+        return self.driver.execute_script(_USABLE_ELEMENTS_SCRIPT, elements)
+    
+    def find_in_any_iframe(self, selectors):
+        """
+        Find an element inside any iframe, at any nesting depth
+        
+        Same-origin iframes are searched in a single script call. Cross-origin
+        iframes cannot be read from the page, so they are switched into and
+        probed one at a time only if that search finds nothing. On success the
+        driver is left switched into the iframe that holds the element.
+        
+        Args:
+            selectors (list): List of CSS selectors, XPath expressions or locators
+            
+        Returns:
+            WebElement or None
+        """
+        locators = to_locators(selectors)
+        
+        try:
+            self.driver.switch_to.default_content()
+            result = self.driver.execute_script(_IFRAME_MATCH_SCRIPT, [list(locator) for locator in locators])
+            
+            if result['match']:
+                frame_path, index = result['match']
+                self._switch_to_frame_path(frame_path)
+                element = self.driver.find_element(*locators[index])
+                logger.debug(f"Found element in iframe path {frame_path} using selector: {locators[index][1]}")
+                return element
+            
+            for frame_path in result['blocked']:
+                self._switch_to_frame_path(frame_path)
+                element = self.find_element_js(locators)
+                if element:
+                    logger.debug(f"Found element in cross-origin iframe path {frame_path}")
+                    return element
+            
+            self.driver.switch_to.default_content()
+            return None
+        except Exception as e:
+            logger.warning(f"Could not search iframes: {e}")
+            self.driver.switch_to.default_content()
+            return None
+    
+    def _switch_to_frame_path(self, frame_path):
+        """Switch from the top-level document through a path of iframe indices"""
+        self.driver.switch_to.default_content()
+        for frame_index in frame_path:
+            frames = self.driver.find_elements(By.TAG_NAME, "iframe")
+            self.driver.switch_to.frame(frames[frame_index])
 
 class ActionHelper:
     """Helper class for common web automation actions"""
@@ -123,6 +524,24 @@ class ActionHelper:
         self.driver = driver
         self.element_finder = element_finder
     
+    def scroll_into_view(self, element, timeout=0.5):
+        """
+        Scroll an element into view and wait until the scroll has settled
+        
+        Args:
+            element: WebElement to scroll to
+            timeout (float): Upper bound for the wait
+        """
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda driver: driver.execute_script(_IN_VIEWPORT_SCRIPT, element)
+            )
+        except TimeoutException:
+            # Elements taller than the viewport never fit; click anyway
+            logger.debug("Element not fully in viewport after scrolling")
+    
     def safe_click(self, element, retries=3):
         """
         Safely click an element with retries
@@ -136,15 +555,21 @@ class ActionHelper:
         """
         for attempt in range(retries):
             try:
-                self.driver.execute_script("arguments[0].scrollIntoView();", element)
-                time.sleep(0.5)
+                self.driver.execute_script(_SCROLL_AND_CLICK_SCRIPT, element)
+                logger.debug("Successfully clicked element")
+                return True
+            except Exception as e:
+                logger.debug(f"Script click failed, falling back to a native click: {e}")
+            
+            try:
+                self.scroll_into_view(element)
                 element.click()
                 logger.debug("Successfully clicked element")
                 return True
             except Exception as e:
                 logger.warning(f"Click attempt {attempt + 1} failed: {e}")
                 if attempt < retries - 1:
-                    time.sleep(Config.TIMING['action_delay'])
+                    time.sleep(_ACTION_DELAY)
         
         logger.error("Failed to click element after all retries")
         return False
@@ -162,21 +587,69 @@ class ActionHelper:
             bool: Success status
         """
         try:
-            self.driver.execute_script("arguments[0].scrollIntoView();", element)
+            self.scroll_into_view(element)
             element.click()
-            time.sleep(0.5)
+            
+            # Wait for the click to focus the element rather than sleeping
+            try:
+                WebDriverWait(self.driver, 0.5, poll_frequency=0.05).until(
+                    lambda driver: driver.execute_script("return document.activeElement === arguments[0];", element)
+                )
+            except TimeoutException:
+                logger.debug("Element did not take focus, typing anyway")
             
             if clear_first:
                 element.clear()
-                time.sleep(0.5)
             
             element.send_keys(text)
-            logger.debug(f"Successfully sent text to element: {text[:50]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Successfully sent text to element: {text[:50]}...")
             return True
         except Exception as e:
             logger.error(f"Failed to send keys to element: {e}")
             return False
     
+    def set_editor_value(self, element, text):
+        """
+        Replace the content of an editor element in a single script call
+        
+        Unlike send_keys this does not type the text key by key, so the
+        cost does not grow with the length of the text. The content is read
+        back afterwards, since an editor whose model ignores a plain value
+        or text change would otherwise be reported as filled in.
+        
+        Args:
+            element: Editor WebElement (textarea, input or contenteditable)
+            text (str): Text to set
+            
+        Returns:
+            bool: True if the editor holds the text afterwards
+        """
+        try:
+            method = self.driver.execute_script(_SET_EDITOR_VALUE_SCRIPT, element, text)
+            if self.get_editor_value(element) != text:
+                logger.debug(f"Editor did not keep the value set via {method}")
+                return False
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Set editor value via {method}: {text[:50]}...")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to set editor value directly: {e}")
+            return False
+    
+    def get_editor_value(self, element):
+        """
+        Read the current content of an editor element
+        
+        Args:
+            element: Editor WebElement (textarea, input or contenteditable)
+            
+        Returns:
+            str: Editor content
+        """
+        return self.driver.execute_script(_GET_EDITOR_VALUE_SCRIPT, element)
+    
     def extract_text_from_elements(self, elements):
         """
         Extract and clean text from multiple elements
@@ -187,41 +660,131 @@ class ActionHelper:
         Returns:
             str: Combined cleaned text
         """
-        text_lines = []
+        if not elements:
+            return ""
         
-        for element in elements:
-            try:
-                text = element.text.strip()
-                if text and text not in text_lines:
-                    text_lines.append(text)
-            except Exception as e:
-                logger.warning(f"Failed to extract text from element: {e}")
+        try:
+            # Read every element's text in one round-trip
+            texts = self.driver.execute_script(_ELEMENT_TEXTS_SCRIPT, elements)
+        except Exception as e:
+            logger.warning(f"Failed to extract text from elements: {e}")
+            texts = []
+        
+        # Drop empty and repeated lines, keeping first-seen order
+        text_lines = dict.fromkeys(text for text in texts if text)
         
         combined_text = "\n".join(text_lines)
-        logger.debug(f"Extracted text: {combined_text[:100]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Extracted text: {combined_text[:100]}...")
         return combined_text
     
     def wait_for_page_load(self, timeout=None):
         """
         Wait for page to be fully loaded
         
+        With the 'eager' page load strategy the DOM is considered ready once
+        it is interactive; sub-resources are not waited for.
+        
         Args:
             timeout (int): Custom timeout
         """
-        wait_time = timeout or Config.TIMING['page_load']
+        wait_time = _PAGE_LOAD if timeout is None else timeout
+        if _EAGER_PAGE_LOAD:
+            ready_states = ("interactive", "complete")
+        else:
+            ready_states = ("complete",)
+        
         try:
             WebDriverWait(self.driver, wait_time).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
+                lambda driver: driver.execute_script("return document.readyState") in ready_states
             )
             time.sleep(1)  # Additional wait for dynamic content
             logger.debug("Page fully loaded")
         except TimeoutException:
             logger.warning("Page load timeout reached")
+    
+    def wait_until_settled(self, prev_element=None, next_selectors=None, timeout=None, prev_match=None):
+        """
+        Wait for the page to react to an action instead of sleeping a fixed time
+        
+        Returns as soon as the element the action acted on goes stale or a
+        visible, enabled element of the expected next state appears. Elements
+        of the next state that were already on the page before the action
+        prove nothing, so pass the one found beforehand as prev_match.
+        
+        Args:
+            prev_element: WebElement expected to be replaced by the action (optional)
+            next_selectors (list): Selectors for elements of the next state (optional)
+            timeout (int): Upper bound for the wait
+            prev_match: WebElement matching next_selectors before the action (optional)
+            
+        Returns:
+            bool: True if the page settled before the timeout
+        """
+        wait_time = _ACTION_DELAY if timeout is None else timeout
+        
+        def next_state_ready(driver):
+            match = self.element_finder.find_all_first_match_js(next_selectors, visible_only=True)
+            return bool(match) and any(element != prev_match for element in match[1])
+        
+        conditions = []
+        if prev_element is not None:
+            conditions.append(EC.staleness_of(prev_element))
+        if next_selectors:
+            conditions.append(next_state_ready)
+        
+        if not conditions:
+            return True
+        
+        try:
+            WebDriverWait(self.driver, wait_time, poll_frequency=0.1).until(EC.any_of(*conditions))
+            return True
+        except TimeoutException:
+            logger.debug(f"Page did not settle within {wait_time}s")
+            return False
+    
+    def wait_for_animations(self, timeout=None):
+        """
+        Wait until no CSS animations or transitions are running
+        
+        Args:
+            timeout (int): Upper bound for the wait
+            
+        Returns:
+            bool: True if animations finished before the timeout
+        """
+        wait_time = _ACTION_DELAY if timeout is None else timeout
+        
+        try:
+            WebDriverWait(self.driver, wait_time, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(_ANIMATIONS_DONE_SCRIPT)
+            )
+            return True
+        except TimeoutException:
+            logger.debug(f"Animations still running after {wait_time}s")
+            return False
+
+# Screenshots are written to disk in the background; pending writes are
+# finished before the interpreter exits
+_screenshot_pool = ThreadPoolExecutor(max_workers=1)
+atexit.register(_screenshot_pool.shutdown)
+
+def _write_screenshot(filename, png, error_description):
+    """Write a captured screenshot to disk"""
+    try:
+        with open(filename, 'wb') as file:
+            file.write(png)
+        logger.info(f"Screenshot saved: {filename} - {error_description}")
+    except Exception as e:
+        logger.error(f"Failed to save screenshot: {e}")
 
 def take_screenshot_on_error(driver, error_description):
     """
     Take a screenshot when an error occurs
     
+    The page is captured right away, before it can change, while the file
+    is written in the background so the caller can carry on.
+    
     Args:
         driver: WebDriver instance
         error_description (str): Description of the error
@@ -230,36 +793,46 @@ def take_screenshot_on_error(driver, error_description):
         try:
             timestamp = int(time.time())
             filename = f"error_screenshot_{timestamp}.png"
-            driver.save_screenshot(filename)
-            logger.info(f"Screenshot saved: {filename} - {error_description}")
+            png = driver.get_screenshot_as_png()
+            _screenshot_pool.submit(_write_screenshot, filename, png, error_description)
         except Exception as e:
             logger.error(f"Failed to take screenshot: {e}")
 
-def retry_on_failure(func, max_retries=None, delay=None):
+def retry_on_failure(max_retries=None, delay=None):
     """
-    Decorator to retry function calls on failure
+    Decorator factory to retry function calls on failure with exponential backoff
+    
+    Retry settings are read from Config when the decorated function is
+    called, so changes to Config.ERROR_HANDLING take effect at runtime.
     
     Args:
-        func: Function to retry
         max_retries (int): Maximum number of retries
-        delay (int): Delay between retries
+        delay (float): Delay before the first retry, doubled on each further one
         
     Returns:
-        Function result or None if all retries fail
+        Decorator for the function to retry
     """
-    retries = max_retries or Config.ERROR_HANDLING['max_retries']
-    retry_delay = delay or Config.ERROR_HANDLING['retry_delay']
-    
-    def wrapper(*args, **kwargs):
-        for attempt in range(retries + 1):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                if attempt < retries:
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {retry_delay}s...")
-                    time.sleep(retry_delay)
-                else:
-                    logger.error(f"All {retries + 1} attempts failed for {func.__name__}")
-                    raise e
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            error_handling = Config.ERROR_HANDLING
+            retries = error_handling['max_retries'] if max_retries is None else max_retries
+            base_delay = error_handling['retry_delay'] if delay is None else delay
+            max_delay = error_handling['retry_max_delay']
+            
+            for attempt in range(retries + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt < retries:
+                        # Jitter keeps parallel workers from retrying in lockstep
+                        retry_delay = min(base_delay * 2 ** attempt + random.random() * 0.1, max_delay)
+                        logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {retry_delay:.2f}s...")
+                        time.sleep(retry_delay)
+                    else:
+                        logger.error(f"All {retries + 1} attempts failed for {func.__name__}")
+                        raise
+        
+        return wrapper
     
-    return wrapper
+    return decorator